@@ -2,15 +2,11 @@
 import argparse
 import contextlib
 import os
-import subprocess
 import sys
-import warnings
-
-from django.utils.encoding import force_str
-from docopt import DocoptExit, docopt
+from importlib import import_module
 
 from . import __version__
-from .utils import _create_db, _make_settings, ensure_unicoded_and_unique, persistent_dir, temp_dir, work_in
+from .utils import CMS, _create_db, _make_settings, ensure_unicoded_and_unique, persistent_dir, temp_dir, work_in
 
 __doc__ = """django CMS applications development helper script.
 
@@ -63,6 +59,8 @@ def _parse_runner_options(test_runner_class, options):
 
 
 def _test_run_worker(test_labels, test_runner, failfast=False, runner_options=None, verbose=1):
+    import warnings
+
     warnings.filterwarnings(
         "error", r"DateTimeField received a naive datetime", RuntimeWarning, r"django\.db\.models\.fields",
     )
@@ -75,7 +73,12 @@ def _test_run_worker(test_labels, test_runner, failfast=False, runner_options=No
         verbose = 1
     runner_options = runner_options or []
     settings.TEST_RUNNER = test_runner
-    TestRunner = get_runner(settings)  # NOQA
+    # skip get_runner import machinery if the runner module is already loaded
+    runner_module, __, runner_class = test_runner.rpartition(".")
+    if runner_module in sys.modules:
+        TestRunner = getattr(sys.modules[runner_module], runner_class)  # NOQA
+    else:
+        TestRunner = get_runner(settings)  # NOQA
 
     kwargs = {"verbosity": verbose, "interactive": False, "failfast": failfast}
     if runner_options:
@@ -165,12 +168,17 @@ def generate_authors():
     """
     Updates the authors list
     """
+    import subprocess
+
     print("Generating AUTHORS")
 
     # Get our list of authors
     print("Collecting author names")
-    r = subprocess.Popen(["git", "log", "--use-mailmap", "--format=%aN"], stdout=subprocess.PIPE)
-    seen_authors = []
+    # git log runs while the AUTHORS file is parsed, its output is then consumed line by line
+    r = subprocess.Popen(
+        ["git", "log", "--use-mailmap", "--format=%aN"], stdout=subprocess.PIPE, bufsize=1, encoding="utf-8"
+    )
+    seen_authors = set()
     authors = []
     for authfile in ("AUTHORS", "AUTHORS.rst"):
         if os.path.exists(authfile):
@@ -178,15 +186,17 @@ def generate_authors():
     with open(authfile) as f:
         for line in f.readlines():
             if line.startswith("*"):
-                author = force_str(line).strip("* \n")
+                author = line.strip("* \n")
                 if author.lower() not in seen_authors:
-                    seen_authors.append(author.lower())
+                    seen_authors.add(author.lower())
                     authors.append(author)
-    for author in r.stdout.readlines():
-        author = force_str(author).strip()
-        if author.lower() not in seen_authors:
-            seen_authors.append(author.lower())
-            authors.append(author)
+    with r.stdout:
+        for author in r.stdout:
+            author = author.strip()
+            if author.lower() not in seen_authors:
+                seen_authors.add(author.lower())
+                authors.append(author)
+    r.wait()
 
     # Sort our list of Authors by their case insensitive name
     authors = sorted(authors, key=lambda x: x.lower())
@@ -200,20 +210,27 @@ def static_analisys(application):
     Performs a pyflakes static analysis with the same configuration as
     django CMS testsuite
     """
-    try:
-        from cms.test_utils.util.static_analysis import pyflakes
-
-        application_module = __import__(application)
-        report = pyflakes((application_module,))
-        if type(report) == tuple:
-            assert report[0] == 0
-        else:
-            assert report == 0
-    except ImportError:
+    pyflakes = None
+    if CMS:
+        try:
+            from cms.test_utils.util.static_analysis import pyflakes
+        except ImportError:  # pragma: no cover
+            pass
+    if not pyflakes:
         print(
             "Static analysis available only if django CMS and pyflakes are installed.\n"
             "Install django-app-helper[pyflakes] to fix this."
         )
+        return
+
+    # analyse the top level package, which is already loaded by django setup
+    package = application.split(".")[0]
+    application_module = sys.modules.get(package) or import_module(package)
+    report = pyflakes((application_module,))
+    if type(report) == tuple:
+        assert report[0] == 0
+    else:
+        assert report == 0
 
 
 def server(
@@ -229,14 +246,16 @@ def setup_env(settings):
 
 
 def _map_argv(argv, application_module):
+    from docopt import DocoptExit, docopt, printable_usage
+
+    if argv[2] == "help":
+        # no need to parse the whole grammar just to print the usage
+        DocoptExit.usage = printable_usage(__doc__)
+        raise DocoptExit()
     try:
         # by default docopt uses sys.argv[1:]; ensure correct args passed
         args = docopt(__doc__, argv=argv[1:], version=application_module.__version__)
-        if argv[2] == "help":
-            raise DocoptExit()
     except DocoptExit:
-        if argv[2] == "help":
-            raise
         args = docopt(__doc__, argv[1:3], version=application_module.__version__)
     args["--cms"] = "--cms" in argv
     args["--persistent"] = "--persistent" in argv
@@ -257,6 +276,8 @@ def _map_argv(argv, application_module):
 
 
 def core(args, application):
+    import warnings
+
     from django.conf import settings
 
     # configure django
@@ -273,92 +294,89 @@ def core(args, application):
         create_dir = temp_dir
         parent_path = "/dev/shm"
 
-    with create_dir("static", parent_path) as STATIC_ROOT:  # NOQA
-        with create_dir("media", parent_path) as MEDIA_ROOT:  # NOQA
-            args["MEDIA_ROOT"] = MEDIA_ROOT
-            args["STATIC_ROOT"] = STATIC_ROOT
-            if args["cms_check"]:
-                args["--cms"] = True
-
-            if args["<command>"]:
-                from django.core.management import execute_from_command_line
-
-                options = [
-                    option
-                    for option in args["options"]
-                    if (
-                        option != "--cms"
-                        and "--extra-settings" not in option
-                        and not option.startswith("--persistent")
-                    )
-                ]
-                _make_settings(args, application, settings, STATIC_ROOT, MEDIA_ROOT)
-                execute_from_command_line(options)
-
-            else:
-                _make_settings(args, application, settings, STATIC_ROOT, MEDIA_ROOT)
-                # run
-                if args["test"]:
-                    if args["--runner"]:
-                        runner = args["--runner"]
-                    else:
-                        runner = settings.TEST_RUNNER
-
-                    # make "Address already in use" errors less likely, see Django
-                    # docs for more details on this env variable.
-                    os.environ.setdefault("DJANGO_LIVE_TEST_SERVER_ADDRESS", "localhost:8000-9000")
-                    if args["--xvfb"]:  # pragma: no cover
-                        import xvfbwrapper
-
-                        context = xvfbwrapper.Xvfb(width=1280, height=720)
-                    else:
-
-                        @contextlib.contextmanager
-                        def null_context():
-                            yield
-
-                        context = null_context()
-
-                    with context:
-                        num_failures = test(
-                            args["<test-label>"],
-                            application,
-                            args["--failfast"],
-                            runner,
-                            args["--runner-options"],
-                            args.get("--verbose", 1),
-                        )
-                        sys.exit(num_failures)
-                elif args["server"]:
-                    server(
-                        settings,
-                        args["--bind"],
-                        args["--port"],
-                        args.get("--migrate", True),
-                        args.get("--verbose", 1),
-                        args.get("--use-channels", False),
-                        args.get("--use-daphne", False),
-                    )
-                elif args["cms_check"]:
-                    cms_check(args.get("--migrate", True))
-                elif args["compilemessages"]:
-                    compilemessages(application)
-                elif args["makemessages"]:
-                    makemessages(application, locale=args["--locale"])
-                elif args["makemigrations"]:
-                    makemigrations(
+    with contextlib.ExitStack() as stack:
+        STATIC_ROOT = stack.enter_context(create_dir("static", parent_path))  # NOQA
+        MEDIA_ROOT = stack.enter_context(create_dir("media", parent_path))  # NOQA
+        args["MEDIA_ROOT"] = MEDIA_ROOT
+        args["STATIC_ROOT"] = STATIC_ROOT
+        if args["cms_check"]:
+            args["--cms"] = True
+
+        if args["<command>"]:
+            from django.core.management import execute_from_command_line
+
+            options = [
+                option
+                for option in args["options"]
+                if (option != "--cms" and "--extra-settings" not in option and not option.startswith("--persistent"))
+            ]
+            _make_settings(args, application, settings, STATIC_ROOT, MEDIA_ROOT)
+            execute_from_command_line(options)
+
+        else:
+            _make_settings(args, application, settings, STATIC_ROOT, MEDIA_ROOT)
+            # run
+            if args["test"]:
+                if args["--runner"]:
+                    runner = args["--runner"]
+                else:
+                    runner = settings.TEST_RUNNER
+
+                # make "Address already in use" errors less likely, see Django
+                # docs for more details on this env variable.
+                os.environ.setdefault("DJANGO_LIVE_TEST_SERVER_ADDRESS", "localhost:8000-9000")
+                if args["--xvfb"]:  # pragma: no cover
+                    import xvfbwrapper
+
+                    context = xvfbwrapper.Xvfb(width=1280, height=720)
+                else:
+
+                    @contextlib.contextmanager
+                    def null_context():
+                        yield
+
+                    context = null_context()
+
+                with context:
+                    num_failures = test(
+                        args["<test-label>"],
                         application,
-                        merge=args["--merge"],
-                        dry_run=args["--dry-run"],
-                        empty=args["--empty"],
-                        extra_applications=args["<extra-applications>"],
+                        args["--failfast"],
+                        runner,
+                        args["--runner-options"],
+                        args.get("--verbose", 1),
                     )
-                elif args["pyflakes"]:
-                    return static_analisys(application)
-                elif args["authors"]:
-                    return generate_authors()
-                elif args["setup"]:
-                    return setup_env(settings)
+                    sys.exit(num_failures)
+            elif args["server"]:
+                server(
+                    settings,
+                    args["--bind"],
+                    args["--port"],
+                    args.get("--migrate", True),
+                    args.get("--verbose", 1),
+                    args.get("--use-channels", False),
+                    args.get("--use-daphne", False),
+                )
+            elif args["cms_check"]:
+                cms_check(args.get("--migrate", True))
+            elif args["compilemessages"]:
+                compilemessages(application)
+            elif args["makemessages"]:
+                makemessages(application, locale=args["--locale"])
+            elif args["makemigrations"]:
+                makemigrations(
+                    application,
+                    merge=args["--merge"],
+                    dry_run=args["--dry-run"],
+                    empty=args["--empty"],
+                    extra_applications=args["<extra-applications>"],
+                )
+            elif args["pyflakes"]:
+                return static_analisys(application)
+            elif args["authors"]:
+                return generate_authors()
+            elif args["setup"]:
+                return setup_env(settings)
 
 
 def main(argv=sys.argv):  # pragma: no cover
@@ -373,4 +391,6 @@ def main(argv=sys.argv):  # pragma: no cover
         args = _map_argv(argv, application_module)
         return core(args=args, application=application)
     else:
+        from docopt import docopt
+
         args = docopt(__doc__, version=__version__)
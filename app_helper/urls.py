@@ -1,3 +1,5 @@
+from importlib.util import find_spec
+
 from django.conf import settings
 from django.conf.urls.i18n import i18n_patterns
 from django.contrib import admin
@@ -6,26 +8,26 @@ from django.urls import include, path
 from django.views.i18n import JavaScriptCatalog
 from django.views.static import serve
 
-from .utils import load_from_file
-
-admin.autodiscover()
-
-urlpatterns = [
-    path(r"media/<str:path>", serve, {"document_root": settings.MEDIA_ROOT, "show_indexes": True}),  # NOQA
-    path(r"jsi18n/<str:packages>", JavaScriptCatalog.as_view()),  # NOQA
-]
 i18n_urls = [
     path("admin/", admin.site.urls),
 ]
 
+application_urls = "%s.urls" % settings.BASE_APPLICATION
 try:
-    load_from_file("%s.urls" % settings.BASE_APPLICATION)
-    i18n_urls.append(path("^%s/" % settings.BASE_APPLICATION, include("%s.urls" % settings.BASE_APPLICATION)))  # NOQA
-except OSError:  # pragma: no cover
-    pass
+    # find_spec only checks the module is available, it's imported by include on demand
+    has_application_urls = application_urls != __name__ and find_spec(application_urls)
+except ImportError:  # pragma: no cover
+    has_application_urls = False
+if has_application_urls:
+    i18n_urls.append(path("%s/" % settings.BASE_APPLICATION, include(application_urls)))  # NOQA
 
 if settings.USE_CMS:
     i18n_urls.append(path("", include("cms.urls")))  # NOQA
 
-urlpatterns += i18n_patterns(*i18n_urls)
-urlpatterns += staticfiles_urlpatterns()
+urlpatterns = [
+    path(r"media/<str:path>", serve, {"document_root": settings.MEDIA_ROOT, "show_indexes": True}),  # NOQA
+    path(r"jsi18n/<str:packages>", JavaScriptCatalog.as_view()),  # NOQA
+    *i18n_patterns(*i18n_urls),
+    # staticfiles_urlpatterns returns no pattern if DEBUG is False
+    *staticfiles_urlpatterns(),
+]
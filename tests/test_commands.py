@@ -899,9 +899,9 @@ class CommandTests(unittest.TestCase):
                     core(args, self.application)
                 except SystemExit:
                     pass
-        self.assertTrue("66 items / 65 deselected / 1 selected" in out.getvalue())
+        self.assertTrue("67 items / 66 deselected / 1 selected" in out.getvalue())
         # warnings will depend on django version and adds too much noise
-        self.assertTrue("1 passed, 65 deselected" in out.getvalue())
+        self.assertTrue("1 passed, 66 deselected" in out.getvalue())
 
     def test_runner_pytest(self):
         """Run tests via pytest via helper runner."""
@@ -916,9 +916,9 @@ class CommandTests(unittest.TestCase):
                     args.append("--runner-options='-k test_create_django_image_object'")
                     args.append("--runner=app_helper.pytest_runner.PytestTestRunner")
                     runner.run("example1", args)
-            self.assertTrue("66 items / 65 deselected / 1 selected" in out.getvalue())
+            self.assertTrue("67 items / 66 deselected / 1 selected" in out.getvalue())
             # warnings will depend on django version and adds too much noise
-            self.assertTrue("1 passed, 65 deselected" in out.getvalue())
+            self.assertTrue("1 passed, 66 deselected" in out.getvalue())
             self.assertEqual(exit_state.exception.code, 0)
 
     def test_authors(self):
@@ -961,3 +961,14 @@ class CommandTests(unittest.TestCase):
                 core(args, self.application)
                 with self.assertRaises(NoReverseMatch):
                     reverse("pages-root")
+
+    def test_urls_application(self):
+        """application urlconf is loaded if available."""
+        from django.urls import reverse
+
+        with work_in(self.basedir):
+            with captured_output() as (out, err):
+                args = copy(DEFAULT_ARGS)
+                args["setup"] = True
+                core(args, self.application)
+                self.assertEqual(reverse("hello"), "/en/example1//hello")